@@ -1,4 +1,22 @@
 
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional
+    np = None
+
+try:
+    import numba
+except ImportError:     # Numba is optional; the native search then runs as plain Python
+    numba = None
+
+try:
+    import animalgame_core
+except ImportError:     # Compiled core not built; the native search uses negamax_nb
+    animalgame_core = None
+
 class Piece:
     """
     Base class for all animal game pieces.
@@ -10,6 +28,9 @@ class Piece:
     Interacts with:
     - AnimaGame (calls is_valid_move to validate move requests).
     """
+    __slots__ = ('_color',)
+    IS_SLIDING = False      # Sliding pieces are blocked by pieces in their path
+    IS_KING = False         # Capturing a king piece ends the game
 
     def __init__(self, color):
         """
@@ -31,11 +52,33 @@ class Piece:
 
     def valid_move(self, start, end, board):
         """
-        This method will be defined in each piece subclass.
         Checks if the move is allowed for the piece.
+
+        Parameters:
+            start (str): Starting square (e.g., 'a1')
+            end (str): Destination square (e.g., 'a2')
+        """
+        return self.valid_move_idx(ord(start[0]) - 97, ord(start[1]) - 49,
+                                   ord(end[0]) - 97, ord(end[1]) - 49, board)
+
+    def valid_move_idx(self, scol, srow, ecol, erow, board):
+        """
+        This method will be defined in each piece subclass.
+        Checks if the move is allowed for the piece, with squares given
+        as 0-based column and row indices.
         """
         raise NotImplementedError()
 
+    def attacks(self, from_sq):
+        """
+        Returns the bitboard of squares this piece may move to from from_sq,
+        ignoring blockers and friendly pieces.
+
+        Parameters:
+            from_sq (int): Bit index of the starting square
+        """
+        return ATTACKS[self.symbol()][from_sq]
+
     def symbol(self):
         """
         Returns the symbol for the piece.
@@ -46,6 +89,70 @@ class Piece:
 # Character list to replace ord/chr
 COLUMNS =['a', 'b', 'c', 'd', 'e', 'f', 'g']
 
+# Player colors in bitboard order (index 0 and 1)
+COLORS = ('TANGERINE', 'AMETHYST')
+COLOR_IDX = {color: index for index, color in enumerate(COLORS)}
+
+
+def SQ(column, row):
+    """
+    Returns the bit index (0..48) of a square from its 0-based column and row.
+    """
+    return row * 7 + column
+
+
+def _parse_square(square):
+    """
+    Converts a square name (e.g., 'a1') to its bit index.
+
+    Returns:
+        int: Bit index of the square, or None if it is not on the board
+    """
+    if len(square) != 2:
+        return None
+    column = ord(square[0]) - 97    # 'a' -> 0
+    row = ord(square[1]) - 49       # '1' -> 0
+    if 0 <= column < 7 and 0 <= row < 7:
+        return SQ(column, row)
+    return None
+
+
+# Square names by bit index, for converting back to algebraic notation
+SQUARE_NAMES = [COLUMNS[column] + str(row + 1) for row in range(7) for column in range(7)]
+
+
+def _build_between():
+    """
+    Builds BETWEEN[start][end]: a bitboard of the squares strictly between two
+    squares on the same row, column, or diagonal (0 if they are not in line).
+    """
+    between = [[0] * 49 for _ in range(49)]
+    for start in range(49):
+        column_start, row_start = start % 7, start // 7
+        for end in range(49):
+            column_end, row_end = end % 7, end // 7
+            dx = column_end - column_start
+            dy = row_end - row_start
+            if dx != 0 and dy != 0 and abs(dx) != abs(dy):
+                continue
+
+            # Determine direction
+            step_column = (dx > 0) - (dx < 0)
+            step_row = (dy > 0) - (dy < 0)
+
+            mask = 0
+            column = column_start + step_column
+            row = row_start + step_row
+            while column != column_end or row != row_end:
+                mask |= 1 << SQ(column, row)
+                column += step_column
+                row += step_row
+            between[start][end] = mask
+    return between
+
+
+BETWEEN = _build_between()
+
 # Piece subclasses with rules
 class Chinchilla(Piece):
     """
@@ -53,9 +160,12 @@ class Chinchilla(Piece):
     It moves exactly 1 square in any direction — orthogonal or diagonal.
     Since it's a sliding piece with a move distance of 1, it is allowed to move 1 square in all directions.
     """
-    def valid_move(self, start, end, board):
-        dx = abs(COLUMNS.index(start[0]) - COLUMNS.index(end[0]))   # column difference
-        dy = abs(int(start[1]) - int(end[1]))   # row difference
+    __slots__ = ()
+    IS_SLIDING = True
+
+    def valid_move_idx(self, scol, srow, ecol, erow, board):
+        dx = abs(scol - ecol)   # column difference
+        dy = abs(srow - erow)   # row difference
         return max(dx, dy) == 1 # any direction one sliding
 
     def symbol(self):
@@ -68,9 +178,12 @@ class Wombat(Piece):
     or it can alternatively move 1 square diagonally.
     Since it's a jumping piece, it can move either its full jump distance or take a 1-square diagonal step.
     """
-    def valid_move(self, start, end, board):
-        dx = abs(COLUMNS.index(start[0]) - COLUMNS.index(end[0]))
-        dy = abs(int(start[1]) - int(end[1]))
+    __slots__ = ()
+    IS_SLIDING = False
+
+    def valid_move_idx(self, scol, srow, ecol, erow, board):
+        dx = abs(scol - ecol)
+        dy = abs(srow - erow)
         abs_dx = abs(dx)
         abs_dy = abs(dy)
         return (abs_dx == 4 and dy == 0) or (abs_dy == 4 and dx == 0) or (abs_dx == 1 and abs_dy == 1)
@@ -85,9 +198,12 @@ class Emu(Piece):
     or move exactly 1 square diagonally.
     Since it's a sliding piece, it may move 1 square in any direction including diagonals.
     """
-    def valid_move(self, start, end, board):
-        dx = abs(COLUMNS.index(start[0]) - COLUMNS.index(end[0]))
-        dy = abs(int(start[1]) - int(end[1]))
+    __slots__ = ()
+    IS_SLIDING = True
+
+    def valid_move_idx(self, scol, srow, ecol, erow, board):
+        dx = abs(scol - ecol)
+        dy = abs(srow - erow)
         if dx == 0 and 1<= dy <= 3:
             return True
         if dy == 0 and 1<= dx <= 3:
@@ -105,14 +221,153 @@ class Cuttlefish(Piece):
     It jumps exactly 2 squares diagonally, or can alternatively move 1 square orthogonally.
     If a Cuttlefish is captured, the game ends immediately.
     """
-    def valid_move(self, start, end, board):
-        dx = abs(COLUMNS.index(start[0]) - COLUMNS.index(end[0]))
-        dy = abs(int(start[1]) - int(end[1]))
+    __slots__ = ()
+    IS_SLIDING = False
+    IS_KING = True
+
+    def valid_move_idx(self, scol, srow, ecol, erow, board):
+        dx = abs(scol - ecol)
+        dy = abs(srow - erow)
         return (dx == 2 and dy == 2) or (dx == 1 and dy == 0) or (dx == 0 and dy == 1)
 
     def symbol(self):
         return "U"
 
+
+def _build_attacks():
+    """
+    Builds ATTACKS[symbol][from_sq]: a bitboard of every square each piece
+    type may move to, using the piece's valid_move_idx as the reference rules.
+    """
+    attacks = {}
+    for piece_class in (Chinchilla, Wombat, Emu, Cuttlefish):
+        piece = piece_class('TANGERINE')
+        masks = [0] * 49
+        for start in range(49):
+            for end in range(49):
+                if piece.valid_move_idx(start % 7, start // 7, end % 7, end // 7, None):
+                    masks[start] |= 1 << end
+        attacks[piece.symbol()] = masks
+    return attacks
+
+
+ATTACKS = _build_attacks()
+
+# Piece classes by symbol, in bitboard order
+PIECE_TYPES = {'C': Chinchilla, 'W': Wombat, 'E': Emu, 'U': Cuttlefish}
+
+# Shared piece instances by (color, name); pieces never change after creation
+PIECES = {}
+for _color in COLORS:
+    PIECES[(_color, 'chinchilla')] = Chinchilla(_color)
+    PIECES[(_color, 'wombat')] = Wombat(_color)
+    PIECES[(_color, 'emu')] = Emu(_color)
+    PIECES[(_color, 'cuttlefish')] = Cuttlefish(_color)
+
+# Material values used by the search; the Cuttlefish value only matters for move ordering
+PIECE_VALUES = {'C': 100, 'W': 300, 'E': 350, 'U': 10000}
+MOBILITY_WEIGHT = 2 # Score per square a color's pieces can reach
+INF = 1000000       # Score of a won position (enemy Cuttlefish captured)
+
+# Zobrist keys: ZOB[square][color index][symbol], plus the key for AMETHYST to move
+_zobrist_random = random.Random(0xAC05)
+ZOB = [[{symbol: _zobrist_random.getrandbits(64) for symbol in PIECE_TYPES} for _ in COLORS] for _ in range(49)]
+ZOB_SIDE = _zobrist_random.getrandbits(64)
+
+# Depth reduction for the null-move search
+NULL_MOVE_REDUCTION = 2
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+class Board:
+    """
+    Flat list of the 49 squares (indexed by bit index), backed by bitboards.
+
+    Responsibilities:
+    - Hold a piece or None for every square; square names ('a1'..'g7')
+      can be used as keys, e.g. board['a1'].
+    - Keep the occupancy, per-color, and per-(color, piece type) bitboards
+      in sync with every assignment.
+
+    Interacts with:
+    - AnimalGame (queries the bitboards when validating moves).
+    """
+    def __init__(self):
+        """
+        Creates an empty board with all bitboards cleared.
+        """
+        self._squares = [None] * 49         # Piece (or None) by bit index
+        self._occ = 0                       # All occupied squares
+        self._occ_by_color = [0, 0]         # Occupied squares per color
+        self._piece_bb = {(color, symbol): 0 for color in COLORS for symbol in PIECE_TYPES}
+        self._hash = 0                      # Zobrist hash of the piece placement
+
+    def __setitem__(self, square, piece):
+        """
+        Places a piece (or None) on a square and updates the bitboards.
+        """
+        sq = _parse_square(square)
+        if sq is None:
+            raise KeyError(square)
+        self.place(sq, piece)
+
+    def __getitem__(self, square):
+        """
+        Returns the piece (or None) on a square.
+        """
+        sq = _parse_square(square)
+        if sq is None:
+            raise KeyError(square)
+        return self._squares[sq]
+
+    def __contains__(self, square):
+        """
+        Returns True if the square name is on the board.
+        """
+        return _parse_square(square) is not None
+
+    def get(self, square, default=None):
+        """
+        Returns the piece (or None) on a square, or default if the square is not on the board.
+        """
+        sq = _parse_square(square)
+        if sq is None:
+            return default
+        return self._squares[sq]
+
+    def piece_at(self, sq):
+        """
+        Returns the piece on the square with bit index sq, or None.
+        """
+        return self._squares[sq]
+
+    def place(self, sq, piece):
+        """
+        Places a piece (or None) on the square with bit index sq and updates the bitboards.
+        """
+        bit = 1 << sq
+
+        old = self._squares[sq]
+        if old is not None:
+            color = COLOR_IDX[old.color()]
+            self._occ &= ~bit
+            self._occ_by_color[color] &= ~bit
+            self._piece_bb[(old.color(), old.symbol())] &= ~bit
+            self._hash ^= ZOB[sq][color][old.symbol()]
+
+        if piece is not None:
+            color = COLOR_IDX[piece.color()]
+            self._occ |= bit
+            self._occ_by_color[color] |= bit
+            self._piece_bb[(piece.color(), piece.symbol())] |= bit
+            self._hash ^= ZOB[sq][color][piece.symbol()]
+
+        self._squares[sq] = piece
+
+
 # Main game controller
 class AnimalGame:
     """
@@ -127,9 +382,12 @@ class AnimalGame:
         """
         Initializes the game by setting up the board, turn, and state.
         """
-        self._board = {}                    # Dictionary of positions to piece instances
+        self._board = Board()               # Pieces by square, with bitboards
         self._game_state = 'UNFINISHED'     # Current game state
         self._turn = 'TANGERINE'            # Starting player
+        self._tt = {}                       # Transposition table: hash -> (depth, value, flag, best_move)
+        self._killers = [[None, None] for _ in range(64)]   # Two quiet cutoff moves per ply
+        self._history = [[0] * 49 for _ in range(49)]       # Quiet cutoff scores by [start_sq][end_sq]
         self._place_initial_pieces()            # Populate initial piece
 
     def _place_initial_pieces(self):
@@ -139,29 +397,22 @@ class AnimalGame:
         row_order = ['chinchilla', 'wombat', 'emu', 'cuttlefish', 'emu', 'wombat', 'chinchilla']
         for index, name in enumerate(row_order):
             # Place TANGERINE pieces on row 1 (bottom)
-            self._board[COLUMNS[index] + '1'] = self._create_piece(name, 'TANGERINE')
+            self._board.place(SQ(index, 0), self._create_piece(name, 'TANGERINE'))
             # Place AMETHYST pieces on row 7 (top)
-            self._board[COLUMNS[index] + '7'] = self._create_piece(name, 'AMETHYST')
+            self._board.place(SQ(index, 6), self._create_piece(name, 'AMETHYST'))
 
     def _create_piece(self, name, color):
         """
-        Create and return a piece object based on name and color.
+        Return the piece object for a name and color.
 
         Parameters:
             name (str): Type of the piece
             color (str): 'TANGERINE' or 'AMETHYST'
 
         Returns:
-            piece: Corresponding piece instance
+            piece: Corresponding shared piece instance
         """
-        if name == 'chinchilla':
-            return Chinchilla(color)
-        elif name == 'wombat':
-            return Wombat(color)
-        elif name == 'emu':
-            return Emu(color)
-        elif name == 'cuttlefish':
-            return Cuttlefish(color)
+        return PIECES[(color, name)]
 
     def get_game_state(self):
         """
@@ -188,79 +439,645 @@ class AnimalGame:
         if self._game_state != 'UNFINISHED':
             return False
 
-        if start not in self._board or self._board[start] is None:
+        start_sq = _parse_square(start)
+        end_sq = _parse_square(end)
+        if start_sq is None or end_sq is None:
             return False
 
-        piece = self._board[start]
+        piece = self._board.piece_at(start_sq)
+        if piece is None:
+            return False
 
         if piece.color() != self._turn:
             return False
 
-        if not piece.valid_move(start, end, self._board):
+        if not piece.attacks(start_sq) & (1 << end_sq):
             return False
 
-        target = self._board.get(end)
-        if target and target.color() == self._turn:
+        if self._board._occ_by_color[COLOR_IDX[self._turn]] & (1 << end_sq):
             return False        # Cannot move onto a friendly piece
 
         # If sliding piece exists, check the path
-        if isinstance(piece, Emu) or isinstance(piece, Chinchilla):
-            if not self._path_clear(start, end):
+        if piece.IS_SLIDING:
+            if not self._path_clear(start_sq, end_sq):
                 return False
 
         # Check for win condition
-        if isinstance(target, Cuttlefish):
+        target = self._board.piece_at(end_sq)
+        if target is not None and target.IS_KING:
             self._game_state = 'TANGERINE_WON' if target.color() == 'AMETHYST' else 'AMETHYST_WON'
 
-        self._board[end] = piece        # Move piece to destination
-        self._board[start] = None       # Clear start square
+        self._board.place(end_sq, piece)        # Move piece to destination
+        self._board.place(start_sq, None)       # Clear start square
         self._turn = 'AMETHYST' if self._turn == 'TANGERINE' else 'TANGERINE'
         return True
 
-    def _path_clear(self, start, end):
+    def _path_clear(self, start_sq, end_sq):
         """
         Check if sliding movement path is clear of other pieces.
         Only used by Emu and Chinchilla.
+
+        Parameters:
+            start_sq (int): Bit index of the starting square
+            end_sq (int): Bit index of the destination square
         """
-        column_start = COLUMNS.index(start[0])
-        row_start = int(start[1])
-        column_end = COLUMNS.index(end[0])
-        row_end = int(end[1])
+        return (self._board._occ & BETWEEN[start_sq][end_sq]) == 0
 
-        dx = column_end - column_start
-        dy = row_end  - row_start
+    def make_move_unchecked(self, start_sq, end_sq):
+        """
+        Moves a piece without any validation and switches the turn.
+        Used by the search; the game state is not updated.
 
-        # Determine direction
-        step_column = 0 if dx == 0 else (1 if dx > 0 else -1)
-        step_row = 0 if dy == 0 else (1 if dy > 0 else -1)
+        Parameters:
+            start_sq (int): Bit index of the starting square
+            end_sq (int): Bit index of the destination square
 
-        column = column_start + step_column
-        row = row_start + step_row
+        Returns:
+            piece: The captured piece (or None), to be passed to undo_move
+        """
+        board = self._board
+        captured = board.piece_at(end_sq)
+        board.place(end_sq, board.piece_at(start_sq))
+        board.place(start_sq, None)
+        self._turn = 'AMETHYST' if self._turn == 'TANGERINE' else 'TANGERINE'
+        return captured
 
-        while column != column_end or row != row_end:
-            position = COLUMNS[column] + str(row)
-            if self._board.get(position) is not None:
-                return False
-            column += step_column
-            row += step_row
+    def undo_move(self, start_sq, end_sq, captured):
+        """
+        Reverts a move made with make_move_unchecked.
 
-        return True
+        Parameters:
+            start_sq (int): Bit index of the starting square
+            end_sq (int): Bit index of the destination square
+            captured (piece): Piece returned by make_move_unchecked
+        """
+        board = self._board
+        board.place(start_sq, board.piece_at(end_sq))
+        board.place(end_sq, captured)
+        self._turn = 'AMETHYST' if self._turn == 'TANGERINE' else 'TANGERINE'
+
+    def best_move(self, depth):
+        """
+        Searches for the best move of the player to move.
+
+        Parameters:
+            depth (int): Search depth in plies (at least 1)
+
+        Returns:
+            tuple: (start, end) squares of the best move, or None if there is none
+        """
+        if self._game_state != 'UNFINISHED':
+            return None
+
+        # Iterative deepening: each iteration seeds move ordering for the next
+        self._reset_move_ordering()
+        move = None
+        for current_depth in range(1, depth + 1):
+            move = self._negamax_root(current_depth)
+            if move is None:
+                return None
+        return SQUARE_NAMES[move[0]], SQUARE_NAMES[move[1]]
+
+    def search_timed(self, seconds):
+        """
+        Searches with iterative deepening (depth 1, 2, 3, ...) until the time
+        budget is used up. An iteration that has started is always finished,
+        so the call may run over the budget by up to one iteration.
+
+        Parameters:
+            seconds (float): Time budget for the search
+
+        Returns:
+            tuple: (start, end) squares of the best move, or None if there is none
+        """
+        if self._game_state != 'UNFINISHED':
+            return None
+
+        start_time = time.monotonic()
+        self._reset_move_ordering()
+        move = None
+        for depth in range(1, 64):
+            move = self._negamax_root(depth)
+            if move is None:
+                return None
+            if time.monotonic() - start_time > seconds:
+                break
+        return SQUARE_NAMES[move[0]], SQUARE_NAMES[move[1]]
+
+    def _reset_move_ordering(self):
+        """
+        Clears the killer moves and history scores before a new search.
+        """
+        self._killers = [[None, None] for _ in range(64)]
+        self._history = [[0] * 49 for _ in range(49)]
+
+    def _negamax_root(self, depth):
+        """
+        Runs the negamax search at the root and returns the best
+        (start_sq, end_sq) pair, or None if there are no moves.
+        The best move of the previous iteration is searched first.
+        """
+        board = self._board
+        side = COLOR_IDX[self._turn]
+        color_sign = 1 if side == 0 else -1
+        key = board._hash ^ ZOB_SIDE if side else board._hash
+        entry = self._tt.get(key)
+
+        alpha = -INF - 1
+        best = None
+        for move in self._generate_moves(side, entry[3] if entry is not None else None):
+            captured = self.make_move_unchecked(move[0], move[1])
+            score = -self._negamax(depth - 1, 1, -INF - 1, -alpha, -color_sign)
+            self.undo_move(move[0], move[1], captured)
+            if score > alpha:
+                alpha = score
+                best = move
+
+        self._tt[key] = (depth, alpha, TT_EXACT, best)
+        return best
+
+    def _negamax(self, depth, ply, alpha, beta, color_sign, allow_null=True):
+        """
+        Negamax search with alpha-beta pruning.
+
+        Parameters:
+            depth (int): Remaining depth in plies
+            ply (int): Distance from the root in plies
+            alpha (int): Lower bound for the side to move
+            beta (int): Upper bound for the side to move
+            color_sign (int): 1 if TANGERINE is to move, -1 if AMETHYST is
+            allow_null (bool): False right after a null move, so two passes never follow each other
+
+        Returns:
+            int: Score of the position from the side to move's point of view
+        """
+        board = self._board
+        side = 0 if color_sign > 0 else 1
+        if not board._piece_bb[(COLORS[side], 'U')]:
+            return -INF         # Own Cuttlefish was captured
+        if depth == 0:
+            return self._qsearch(alpha, beta, color_sign)
+
+        # Probe the transposition table
+        key = board._hash ^ ZOB_SIDE if side else board._hash
+        entry = self._tt.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_depth, value, flag, tt_move = entry
+            if tt_depth >= depth:
+                if flag == TT_EXACT:
+                    return value
+                if flag == TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        # Null-move pruning: if passing still fails high, a real move will too
+        if allow_null and depth >= 3 and beta < INF and not self._in_check(side):
+            self._turn = COLORS[1 - side]
+            score = -self._negamax(depth - 1 - NULL_MOVE_REDUCTION, ply + 1, -beta, -beta + 1, -color_sign, False)
+            self._turn = COLORS[side]
+            if score >= beta:
+                return beta
+
+        moves = self._generate_moves(side, tt_move, ply)
+        if not moves:
+            return self._evaluate(color_sign)
+
+        alpha_start = alpha
+        best = None
+        for move in moves:
+            captured = self.make_move_unchecked(move[0], move[1])
+            score = -self._negamax(depth - 1, ply + 1, -beta, -alpha, -color_sign)
+            self.undo_move(move[0], move[1], captured)
+            if score >= beta:
+                if captured is None:
+                    # Remember quiet moves that caused a cutoff
+                    killers = self._killers[ply]
+                    if move != killers[0]:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                    self._history[move[0]][move[1]] += depth * depth
+                self._tt[key] = (depth, beta, TT_LOWER, move)
+                return beta
+            if score > alpha:
+                alpha = score
+                best = move
+
+        self._tt[key] = (depth, alpha, TT_EXACT if alpha > alpha_start else TT_UPPER, best)
+        return alpha
+
+    def _in_check(self, side):
+        """
+        Returns True if the Cuttlefish of a color is on a square the other
+        color's pieces can reach (blockers are ignored).
+
+        Parameters:
+            side (int): Color index
+        """
+        return bool(self._attack_mask(1 - side) & self._board._piece_bb[(COLORS[side], 'U')])
+
+    def _qsearch(self, alpha, beta, color_sign):
+        """
+        Quiescence search: at the end of the main search keep playing
+        captures until the position is quiet, so a capture just past the
+        search depth is not missed.
+
+        Parameters:
+            alpha (int): Lower bound for the side to move
+            beta (int): Upper bound for the side to move
+            color_sign (int): 1 if TANGERINE is to move, -1 if AMETHYST is
+
+        Returns:
+            int: Score of the position from the side to move's point of view
+        """
+        side = 0 if color_sign > 0 else 1
+        if not self._board._piece_bb[(COLORS[side], 'U')]:
+            return -INF         # Own Cuttlefish was captured
+
+        stand_pat = self._evaluate(color_sign)
+        if stand_pat >= beta:
+            return beta
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        for move in self._generate_moves(side, captures_only=True):
+            captured = self.make_move_unchecked(move[0], move[1])
+            score = -self._qsearch(-beta, -alpha, -color_sign)
+            self.undo_move(move[0], move[1], captured)
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _evaluate(self, color_sign):
+        """
+        Static evaluation: material balance plus mobility (squares reachable by
+        each color, ignoring blockers) from the side to move's point of view.
+        """
+        piece_bb = self._board._piece_bb
+        occ_by_color = self._board._occ_by_color
+        score = 0
+        for symbol in ('C', 'W', 'E'):
+            count = bin(piece_bb[('TANGERINE', symbol)]).count('1') - bin(piece_bb[('AMETHYST', symbol)]).count('1')
+            score += PIECE_VALUES[symbol] * count
+
+        mobility = (bin(self._attack_mask(0) & ~occ_by_color[0]).count('1')
+                    - bin(self._attack_mask(1) & ~occ_by_color[1]).count('1'))
+        score += MOBILITY_WEIGHT * mobility
+        return score * color_sign
+
+    def _attack_mask(self, side):
+        """
+        Returns the union of the move targets of all pieces of a color,
+        ignoring blockers and friendly pieces.
+
+        Parameters:
+            side (int): Color index
+        """
+        piece_bb = self._board._piece_bb
+        color = COLORS[side]
+        mask = 0
+        for symbol in PIECE_TYPES:
+            attack_table = ATTACKS[symbol]
+            bb = piece_bb[(color, symbol)]
+            while bb:
+                lsb = bb & -bb
+                mask |= attack_table[lsb.bit_length() - 1]
+                bb ^= lsb
+        return mask
+
+    def _generate_moves(self, side, tt_move=None, ply=0, captures_only=False):
+        """
+        Generates the pseudo-legal moves of a color from the bitboards.
+        The transposition table move comes first, then the captures ordered by
+        MVV-LVA (most valuable victim, then least valuable attacker), then the
+        killer moves of this ply, then the other quiet moves by history score.
+
+        Parameters:
+            side (int): Color index of the side to move
+            tt_move (tuple): Best move stored for this position, if any
+            ply (int): Distance from the root, used to look up killer moves
+            captures_only (bool): Only generate captures (for quiescence search)
+
+        Returns:
+            list: (start_sq, end_sq) pairs
+        """
+        board = self._board
+        color = COLORS[side]
+        own = board._occ_by_color[side]
+        enemy = board._occ_by_color[1 - side]
+        occ = board._occ
+
+        captures = []
+        quiets = []
+        for symbol, piece_class in PIECE_TYPES.items():
+            sliding = piece_class.IS_SLIDING
+            attack_table = ATTACKS[symbol]
+            bb = board._piece_bb[(color, symbol)]
+            while bb:
+                lsb = bb & -bb
+                start_sq = lsb.bit_length() - 1
+                bb ^= lsb
+                targets = attack_table[start_sq] & (enemy if captures_only else ~own)
+                while targets:
+                    bit = targets & -targets
+                    end_sq = bit.bit_length() - 1
+                    targets ^= bit
+                    if sliding and occ & BETWEEN[start_sq][end_sq]:
+                        continue
+                    if enemy & bit:
+                        victim = board.piece_at(end_sq).symbol()
+                        captures.append((PIECE_VALUES[victim], -PIECE_VALUES[symbol], start_sq, end_sq))
+                    else:
+                        quiets.append((start_sq, end_sq))
+
+        captures.sort(reverse=True)
+        if captures_only:
+            return [(start_sq, end_sq) for _, _, start_sq, end_sq in captures]
+
+        history = self._history
+        quiets.sort(key=lambda move: history[move[0]][move[1]], reverse=True)
+        for killer in reversed(self._killers[ply]):
+            if killer is not None and killer in quiets:
+                quiets.remove(killer)
+                quiets.insert(0, killer)
+        moves = [(start_sq, end_sq) for _, _, start_sq, end_sq in captures] + quiets
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
+
+    def _bitboard_state(self):
+        """
+        Returns the 8 piece bitboards in the layout used by negamax_nb.
+        """
+        bitboards = [self._board._piece_bb[(color, symbol)] for color in COLORS for symbol in PIECE_TYPES]
+        if numba is not None:
+            return np.array(bitboards, dtype=np.int64)
+        return bitboards
+
+    def best_move_native(self, depth):
+        """
+        Same as best_move, but runs the integer-only search: the compiled
+        animalgame_core module if it is built, otherwise negamax_nb (compiled
+        to native code when Numba is installed).
+
+        Parameters:
+            depth (int): Search depth in plies (at least 1)
+
+        Returns:
+            tuple: (start, end) squares of the best move, or None if there is none
+        """
+        if self._game_state != 'UNFINISHED':
+            return None
+        if animalgame_core is not None:
+            bitboards = [self._board._piece_bb[(color, symbol)] for color in COLORS for symbol in PIECE_TYPES]
+            move = animalgame_core.best_move(animalgame_core.State(bitboards, COLOR_IDX[self._turn]), depth)
+        else:
+            move = best_move_nb(self._bitboard_state(), COLOR_IDX[self._turn], depth)
+        if move < 0:
+            return None
+        return SQUARE_NAMES[move // 49], SQUARE_NAMES[move % 49]
 
     def print_board(self):
         """
         Prints the current state of the board for debugging.
         """
-        for row in range(7, 0, -1):
-            line = str(row) + " "
-            for column in range(7):
-                square = COLUMNS[column] + str(row)
-                piece = self._board.get(square)
-                if piece:
-                    line += piece.symbol() + " "
-                else:
-                    line += ". "
-            print(line)
-        print("  a b c d e f g")
+        squares = self._board._squares
+        lines = []
+        for row in range(6, -1, -1):
+            cells = [piece.symbol() if piece else "." for piece in squares[row * 7:row * 7 + 7]]
+            lines.append(str(row + 1) + " " + " ".join(cells) + " ")
+        lines.append("  a b c d e f g")
+        print("\n".join(lines))
+
+
+# Integer-only search over 8 bitboards: bitboards[color index * 4 + type],
+# with piece types in PIECE_TYPES order (C, W, E, U).
+if numba is not None:
+    _njit = numba.njit(cache=True)
+    ATTACKS_TABLE = np.array([ATTACKS[symbol] for symbol in PIECE_TYPES], dtype=np.int64)
+    BETWEEN_TABLE = np.array(BETWEEN, dtype=np.int64)
+    VALUES_TABLE = np.array([PIECE_VALUES[symbol] for symbol in PIECE_TYPES], dtype=np.int64)
+else:
+    def _njit(function):
+        return function
+    ATTACKS_TABLE = [ATTACKS[symbol] for symbol in PIECE_TYPES]
+    BETWEEN_TABLE = BETWEEN
+    VALUES_TABLE = [PIECE_VALUES[symbol] for symbol in PIECE_TYPES]
+
+if animalgame_core is not None:
+    animalgame_core.init_tables([ATTACKS[symbol] for symbol in PIECE_TYPES], BETWEEN,
+                                [PIECE_VALUES[symbol] for symbol in PIECE_TYPES], MOBILITY_WEIGHT, INF)
+
+
+@_njit
+def _popcount_nb(bb):
+    """
+    Returns the number of set bits in a bitboard.
+    """
+    count = 0
+    while bb:
+        bb &= bb - 1
+        count += 1
+    return count
+
+
+@_njit
+def _attack_mask_nb(bitboards, base):
+    """
+    Returns the union of the move targets of the pieces in
+    bitboards[base:base + 4], ignoring blockers and friendly pieces.
+    """
+    mask = 0
+    for piece_type in range(4):
+        pieces = bitboards[base + piece_type]
+        for sq in range(49):
+            if (pieces >> sq) & 1:
+                mask |= ATTACKS_TABLE[piece_type][sq]
+    return mask
+
+
+@_njit
+def _evaluate_nb(bitboards, side):
+    """
+    Material balance (Cuttlefish excluded) plus mobility from the point of view of side.
+    """
+    score = 0
+    for piece_type in range(3):
+        count = _popcount_nb(bitboards[piece_type]) - _popcount_nb(bitboards[4 + piece_type])
+        score += VALUES_TABLE[piece_type] * count
+
+    own = bitboards[0] | bitboards[1] | bitboards[2] | bitboards[3]
+    enemy = bitboards[4] | bitboards[5] | bitboards[6] | bitboards[7]
+    mobility = _popcount_nb(_attack_mask_nb(bitboards, 0) & ~own) - _popcount_nb(_attack_mask_nb(bitboards, 4) & ~enemy)
+    score += MOBILITY_WEIGHT * mobility
+    return score if side == 0 else -score
+
+
+@_njit
+def _qsearch_nb(bitboards, side, alpha, beta):
+    """
+    Quiescence search for negamax_nb: searches captures only, most valuable
+    victim and then least valuable attacker first, until the position is quiet.
+    """
+    if bitboards[side * 4 + 3] == 0:
+        return -INF         # Own Cuttlefish was captured
+
+    stand_pat = _evaluate_nb(bitboards, side)
+    if stand_pat >= beta:
+        return beta
+    if stand_pat > alpha:
+        alpha = stand_pat
+
+    own_base = side * 4
+    enemy_base = (1 - side) * 4
+    own = bitboards[own_base] | bitboards[own_base + 1] | bitboards[own_base + 2] | bitboards[own_base + 3]
+    enemy = bitboards[enemy_base] | bitboards[enemy_base + 1] | bitboards[enemy_base + 2] | bitboards[enemy_base + 3]
+    occ = own | enemy
+
+    for victim in range(3, -1, -1):
+        for piece_type in range(4):
+            sliding = piece_type == 0 or piece_type == 2
+            pieces = bitboards[own_base + piece_type]
+            for start_sq in range(49):
+                if not (pieces >> start_sq) & 1:
+                    continue
+                targets = ATTACKS_TABLE[piece_type][start_sq] & bitboards[enemy_base + victim]
+                for end_sq in range(49):
+                    if not (targets >> end_sq) & 1:
+                        continue
+                    if sliding and occ & BETWEEN_TABLE[start_sq][end_sq]:
+                        continue
+                    start_bit = 1 << start_sq
+                    end_bit = 1 << end_sq
+                    bitboards[own_base + piece_type] ^= start_bit | end_bit
+                    bitboards[enemy_base + victim] ^= end_bit
+                    score = -_qsearch_nb(bitboards, 1 - side, -beta, -alpha)
+                    bitboards[enemy_base + victim] ^= end_bit
+                    bitboards[own_base + piece_type] ^= start_bit | end_bit
+                    if score >= beta:
+                        return beta
+                    if score > alpha:
+                        alpha = score
+    return alpha
+
+
+@_njit
+def negamax_nb(bitboards, side, depth, alpha, beta):
+    """
+    Negamax with alpha-beta pruning on the integer bitboard state.
+    Captures are searched first, most valuable victim and then least
+    valuable attacker first, followed by the quiet moves.
+
+    Parameters:
+        bitboards (array): The 8 piece bitboards, updated in place and restored
+        side (int): Color index of the side to move
+        depth (int): Remaining depth in plies
+        alpha (int): Lower bound for the side to move
+        beta (int): Upper bound for the side to move
+
+    Returns:
+        int: Score of the position from the side to move's point of view
+    """
+    if bitboards[side * 4 + 3] == 0:
+        return -INF         # Own Cuttlefish was captured
+    if depth == 0:
+        return _qsearch_nb(bitboards, side, alpha, beta)
+
+    own_base = side * 4
+    enemy_base = (1 - side) * 4
+    own = bitboards[own_base] | bitboards[own_base + 1] | bitboards[own_base + 2] | bitboards[own_base + 3]
+    enemy = bitboards[enemy_base] | bitboards[enemy_base + 1] | bitboards[enemy_base + 2] | bitboards[enemy_base + 3]
+    occ = own | enemy
+
+    has_move = False
+    # Phases 3..0 capture that piece type (most valuable first), phase -1 is quiet moves
+    for phase in range(3, -2, -1):
+        targets_allowed = ~own & ~enemy if phase < 0 else bitboards[enemy_base + phase]
+        for piece_type in range(4):
+            sliding = piece_type == 0 or piece_type == 2
+            pieces = bitboards[own_base + piece_type]
+            for start_sq in range(49):
+                if not (pieces >> start_sq) & 1:
+                    continue
+                targets = ATTACKS_TABLE[piece_type][start_sq] & targets_allowed
+                for end_sq in range(49):
+                    if not (targets >> end_sq) & 1:
+                        continue
+                    if sliding and occ & BETWEEN_TABLE[start_sq][end_sq]:
+                        continue
+                    has_move = True
+                    start_bit = 1 << start_sq
+                    end_bit = 1 << end_sq
+                    bitboards[own_base + piece_type] ^= start_bit | end_bit
+                    if phase >= 0:
+                        bitboards[enemy_base + phase] ^= end_bit
+                    score = -negamax_nb(bitboards, 1 - side, depth - 1, -beta, -alpha)
+                    if phase >= 0:
+                        bitboards[enemy_base + phase] ^= end_bit
+                    bitboards[own_base + piece_type] ^= start_bit | end_bit
+                    if score >= beta:
+                        return beta
+                    if score > alpha:
+                        alpha = score
+
+    if not has_move:
+        return _evaluate_nb(bitboards, side)
+    return alpha
+
+
+@_njit
+def best_move_nb(bitboards, side, depth):
+    """
+    Root of negamax_nb.
+
+    Returns:
+        int: Best move encoded as start_sq * 49 + end_sq, or -1 if there is none
+    """
+    own_base = side * 4
+    enemy_base = (1 - side) * 4
+    own = bitboards[own_base] | bitboards[own_base + 1] | bitboards[own_base + 2] | bitboards[own_base + 3]
+    enemy = bitboards[enemy_base] | bitboards[enemy_base + 1] | bitboards[enemy_base + 2] | bitboards[enemy_base + 3]
+    occ = own | enemy
+
+    best = -1
+    alpha = -INF - 1
+    for piece_type in range(4):
+        sliding = piece_type == 0 or piece_type == 2
+        pieces = bitboards[own_base + piece_type]
+        for start_sq in range(49):
+            if not (pieces >> start_sq) & 1:
+                continue
+            targets = ATTACKS_TABLE[piece_type][start_sq] & ~own
+            for end_sq in range(49):
+                if not (targets >> end_sq) & 1:
+                    continue
+                if sliding and occ & BETWEEN_TABLE[start_sq][end_sq]:
+                    continue
+                # Find the captured piece type, if any
+                captured = -1
+                for victim in range(4):
+                    if (bitboards[enemy_base + victim] >> end_sq) & 1:
+                        captured = victim
+                start_bit = 1 << start_sq
+                end_bit = 1 << end_sq
+                bitboards[own_base + piece_type] ^= start_bit | end_bit
+                if captured >= 0:
+                    bitboards[enemy_base + captured] ^= end_bit
+                score = -negamax_nb(bitboards, 1 - side, depth - 1, -INF - 1, -alpha)
+                if captured >= 0:
+                    bitboards[enemy_base + captured] ^= end_bit
+                bitboards[own_base + piece_type] ^= start_bit | end_bit
+                if score > alpha:
+                    alpha = score
+                    best = start_sq * 49 + end_sq
+    return best
+
 
 # if __name__=="__main__":
 #    game = AnimalGame()
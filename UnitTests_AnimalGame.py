@@ -1,6 +1,8 @@
 
+import contextlib
+import io
 import unittest
-from AnimalGame import AnimalGame, Chinchilla, Wombat, Emu, Cuttlefish
+from AnimalGame import AnimalGame, Chinchilla, Wombat, Emu, Cuttlefish, SQ, BETWEEN, INF, PIECE_VALUES, negamax_nb, numba, animalgame_core
 
 class TestAnimalGame(unittest.TestCase):
 
@@ -99,6 +101,241 @@ class TestAnimalGame(unittest.TestCase):
         moved = game.make_move('c1', 'c3')  # blocked
         self.assertFalse(moved)
 
+    def test_bitboards_follow_board(self):
+        """
+        Test that the occupancy bitboards stay in sync with moves and direct placement.
+        """
+        game = AnimalGame()
+        self.assertEqual(bin(game._board._occ).count('1'), 14)
+        game.make_move('c1', 'c2')
+        self.assertFalse(game._board._occ & (1 << SQ(2, 0)))
+        self.assertTrue(game._board._occ_by_color[0] & (1 << SQ(2, 1)))
+        game._board['d4'] = Wombat('AMETHYST')
+        self.assertTrue(game._board._piece_bb[('AMETHYST', 'W')] & (1 << SQ(3, 3)))
+
+    def test_attack_tables_match_valid_move(self):
+        """
+        Test that the precomputed move tables agree with each piece's valid_move rules.
+        """
+        for piece in (Chinchilla('TANGERINE'), Wombat('TANGERINE'), Emu('TANGERINE'), Cuttlefish('TANGERINE')):
+            for start in ('a1', 'd4', 'g7', 'c5'):
+                for end in ('a1', 'b2', 'c3', 'd4', 'd5', 'd7', 'e1', 'f6', 'g4'):
+                    expected = piece.valid_move(start, end, None)
+                    start_sq = SQ(ord(start[0]) - 97, int(start[1]) - 1)
+                    end_sq = SQ(ord(end[0]) - 97, int(end[1]) - 1)
+                    self.assertEqual(bool(piece.attacks(start_sq) & (1 << end_sq)), expected)
+
+    def test_best_move_captures_cuttlefish(self):
+        """
+        Test that the search finds an immediate Cuttlefish capture.
+        """
+        game = AnimalGame()
+        game._board['d7'] = None
+        game._board['d5'] = Cuttlefish('AMETHYST')
+        game._board['d2'] = Emu('TANGERINE')
+        self.assertEqual(game.best_move(2), ('d2', 'd5'))
+
+    def test_best_move_is_legal_and_search_restores_board(self):
+        """
+        Test that the search leaves the board untouched and returns a legal move.
+        """
+        game = AnimalGame()
+        occ = game._board._occ
+        move = game.best_move(3)
+        self.assertEqual(game._board._occ, occ)
+        self.assertEqual(game._turn, 'TANGERINE')
+        self.assertTrue(game.make_move(*move))
+
+    def test_hash_depends_only_on_position(self):
+        """
+        Test that the Zobrist hash is the same for a position reached by different move orders.
+        """
+        first = AnimalGame()
+        for start, end in (('c1', 'c2'), ('c7', 'c6'), ('e1', 'e2'), ('e7', 'e6')):
+            first.make_move(start, end)
+        second = AnimalGame()
+        for start, end in (('e1', 'e2'), ('e7', 'e6'), ('c1', 'c2'), ('c7', 'c6')):
+            second.make_move(start, end)
+        self.assertEqual(first._board._hash, second._board._hash)
+        self.assertNotEqual(first._board._hash, AnimalGame()._board._hash)
+
+    def test_search_fills_transposition_table(self):
+        """
+        Test that searching stores entries in the transposition table.
+        """
+        game = AnimalGame()
+        game.best_move(3)
+        self.assertTrue(game._tt)
+
+    def test_native_search_matches_python_search(self):
+        """
+        Test that the integer-only search scores positions like the Python search.
+        """
+        game = AnimalGame()
+        game.make_move('c1', 'c3')
+        game.make_move('e7', 'e5')
+        native = negamax_nb(game._bitboard_state(), 0, 2, -INF - 1, INF + 1)
+        self.assertEqual(native, game._negamax(2, 0, -INF - 1, INF + 1, 1))
+        self.assertTrue(game.make_move(*game.best_move_native(2)))
+
+    @unittest.skipIf(numba is None, "Numba is not installed")
+    def test_jitted_search_matches_unjitted(self):
+        """
+        Test that the compiled search gives the same score as its pure Python version.
+        """
+        game = AnimalGame()
+        state = game._bitboard_state()
+        self.assertEqual(negamax_nb(state, 0, 3, -INF - 1, INF + 1),
+                         negamax_nb.py_func(state, 0, 3, -INF - 1, INF + 1))
+
+    def test_off_board_squares_rejected(self):
+        """
+        Test that moves to or from squares outside the 7x7 board are rejected.
+        """
+        game = AnimalGame()
+        self.assertFalse(game.make_move('a1', 'a8'))
+        self.assertFalse(game.make_move('h1', 'g1'))
+        self.assertFalse(game.make_move('a1', 'a0'))
+        self.assertEqual(game._turn, 'TANGERINE')
+
+    def test_pieces_have_no_instance_dict(self):
+        """
+        Test that pieces only store their color slot.
+        """
+        for piece in (Chinchilla('TANGERINE'), Wombat('AMETHYST'), Emu('TANGERINE'), Cuttlefish('AMETHYST')):
+            self.assertFalse(hasattr(piece, '__dict__'))
+
+    def test_pieces_are_shared_between_games(self):
+        """
+        Test that games reuse one piece instance per color and type.
+        """
+        first = AnimalGame()
+        second = AnimalGame()
+        self.assertIs(first._board['a1'], second._board['g1'])
+        self.assertIsNot(first._board['a1'], first._board['a7'])
+
+    def test_between_masks(self):
+        """
+        Test that BETWEEN holds only the squares strictly between two aligned squares.
+        """
+        self.assertEqual(BETWEEN[SQ(2, 0)][SQ(2, 3)], (1 << SQ(2, 1)) | (1 << SQ(2, 2)))
+        self.assertEqual(BETWEEN[SQ(0, 0)][SQ(2, 2)], 1 << SQ(1, 1))
+        self.assertEqual(BETWEEN[SQ(0, 0)][SQ(0, 1)], 0)
+        self.assertEqual(BETWEEN[SQ(0, 0)][SQ(1, 2)], 0)     # not aligned
+
+    def test_emu_slide_blocked_by_enemy_piece(self):
+        """
+        Test that an enemy piece in the middle of an Emu slide blocks it.
+        """
+        game = AnimalGame()
+        game._board['c3'] = Wombat('AMETHYST')
+        self.assertFalse(game.make_move('c1', 'c4'))
+        self.assertTrue(game.make_move('c1', 'c2'))
+
+    def test_search_timed_returns_legal_move(self):
+        """
+        Test that the time-limited search returns a legal move.
+        """
+        game = AnimalGame()
+        move = game.search_timed(0.05)
+        self.assertTrue(game.make_move(*move))
+
+    def test_previous_best_move_searched_first(self):
+        """
+        Test that the stored best move of a position is ordered first.
+        """
+        game = AnimalGame()
+        game.best_move(2)
+        key = game._board._hash
+        self.assertEqual(game._generate_moves(0, game._tt[key][3])[0], game._tt[key][3])
+
+    def test_killer_moves_ordered_before_other_quiet_moves(self):
+        """
+        Test that killer moves of a ply come right after the captures.
+        """
+        game = AnimalGame()
+        killer = (SQ(6, 0), SQ(6, 1))       # g1 -> g2
+        game._killers[2][0] = killer
+        self.assertEqual(game._generate_moves(0, None, 2)[0], killer)
+        self.assertNotEqual(game._generate_moves(0, None, 3)[0], killer)
+
+    def test_board_square_name_access(self):
+        """
+        Test that the board can still be read and written by square name.
+        """
+        game = AnimalGame()
+        self.assertIn('g7', game._board)
+        self.assertNotIn('h1', game._board)
+        self.assertIsNone(game._board.get('h1'))
+        self.assertIsNone(game._board['d4'])
+        with self.assertRaises(KeyError):
+            game._board['d8'] = Emu('TANGERINE')
+
+    def test_quiescence_search_sees_recapture(self):
+        """
+        Test that the quiescence search accounts for a recapture after a capture.
+        """
+        game = AnimalGame()
+        game._board['d4'] = Emu('TANGERINE')
+        game._board['d5'] = Chinchilla('AMETHYST')
+        self.assertGreater(game._qsearch(-INF - 1, INF + 1, 1), game._evaluate(1))
+        game._board['e6'] = Chinchilla('AMETHYST')  # Defends d5, so taking it loses the Emu
+        self.assertEqual(game._qsearch(-INF - 1, INF + 1, 1), game._evaluate(1))
+
+    def test_attack_mask_and_mobility(self):
+        """
+        Test the combined move targets of a color and the mobility term of the evaluation.
+        """
+        game = AnimalGame()
+        self.assertEqual(game._evaluate(1), 0)       # Symmetric start position
+        game._board['d4'] = Emu('TANGERINE')
+        mask = game._attack_mask(0)
+        self.assertTrue(mask & (1 << SQ(3, 6)))      # d4 -> d7
+        self.assertTrue(mask & (1 << SQ(4, 4)))      # d4 -> e5
+        self.assertGreater(game._evaluate(1), PIECE_VALUES['E'])
+
+    def test_print_board_output(self):
+        """
+        Check the rows printed for the starting position.
+        """
+        game = AnimalGame()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.print_board()
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "7 C W E U E W C ")
+        self.assertEqual(lines[3], "4 . . . . . . . ")
+        self.assertEqual(lines[7], "  a b c d e f g")
+
+    def test_in_check_and_null_move_search(self):
+        """
+        Test Cuttlefish attack detection, and that a deeper search (where
+        null-move pruning applies) still finds a Cuttlefish capture.
+        """
+        game = AnimalGame()
+        self.assertFalse(game._in_check(0))
+        game._board['d3'] = Emu('AMETHYST')
+        self.assertTrue(game._in_check(0))
+
+        game = AnimalGame()
+        game._board['d7'] = None
+        game._board['d5'] = Cuttlefish('AMETHYST')
+        game._board['d2'] = Emu('TANGERINE')
+        self.assertEqual(game.best_move(4), ('d2', 'd5'))
+
+    @unittest.skipIf(animalgame_core is None, "animalgame_core is not built")
+    def test_compiled_core_matches_native_search(self):
+        """
+        Test that the compiled core scores positions like negamax_nb.
+        """
+        game = AnimalGame()
+        game.make_move('c1', 'c3')
+        bitboards = [int(bb) for bb in game._bitboard_state()]
+        state = animalgame_core.State(bitboards, 1)
+        self.assertEqual(animalgame_core.negamax(state, 3, -INF - 1, INF + 1),
+                         negamax_nb(game._bitboard_state(), 1, 3, -INF - 1, INF + 1))
+        self.assertTrue(game.make_move(*game.best_move_native(2)))
+
 if __name__ == '__main__':
     unittest.main()
 
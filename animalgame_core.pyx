@@ -0,0 +1,253 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled core of the AnimalGame search.
+
+Same search as negamax_nb in AnimalGame.py (negamax with alpha-beta pruning,
+MVV-LVA ordered captures, quiescence search, material + mobility evaluation),
+written with C integers only so the search loop runs without the GIL.
+
+Build in place with:
+    cythonize -i animalgame_core.pyx
+
+AnimalGame imports this module when it is built and falls back to
+negamax_nb otherwise. The move tables are copied in by init_tables().
+"""
+from libc.stdint cimport int64_t
+
+# Tables copied from AnimalGame by init_tables()
+cdef int64_t ATTACKS[4][49]         # Move targets by [piece type][square]
+cdef int64_t BETWEEN[49][49]        # Squares strictly between two aligned squares
+cdef int64_t VALUES[4]              # Piece values by piece type
+cdef int64_t MOBILITY_WEIGHT = 0
+cdef int64_t INF = 0
+
+
+cdef struct Position:
+    int64_t bb[8]       # Piece bitboards: [color index * 4 + piece type]
+    int64_t occ[2]      # Occupied squares per color
+    int turn            # Color index of the side to move
+
+
+def init_tables(attacks, between, values, mobility_weight, inf):
+    """
+    Copies the move tables and evaluation constants from AnimalGame.
+
+    Parameters:
+        attacks (list): ATTACKS masks by piece type (C, W, E, U), 4 x 49
+        between (list): BETWEEN masks, 49 x 49
+        values (list): Piece values by piece type
+        mobility_weight (int): Score per reachable square
+        inf (int): Score of a won position
+    """
+    global MOBILITY_WEIGHT, INF
+    cdef int piece_type, start_sq, end_sq
+    for piece_type in range(4):
+        VALUES[piece_type] = values[piece_type]
+        for start_sq in range(49):
+            ATTACKS[piece_type][start_sq] = attacks[piece_type][start_sq]
+    for start_sq in range(49):
+        for end_sq in range(49):
+            BETWEEN[start_sq][end_sq] = between[start_sq][end_sq]
+    MOBILITY_WEIGHT = mobility_weight
+    INF = inf
+
+
+cdef class State:
+    """
+    Search position: 8 piece bitboards, per-color occupancy and side to move.
+    """
+    cdef Position pos
+
+    def __init__(self, bitboards, int turn):
+        """
+        Parameters:
+            bitboards (list): The 8 piece bitboards, [color index * 4 + piece type]
+            turn (int): Color index of the side to move
+        """
+        cdef int index
+        self.pos.occ[0] = 0
+        self.pos.occ[1] = 0
+        for index in range(8):
+            self.pos.bb[index] = bitboards[index]
+            self.pos.occ[index // 4] |= self.pos.bb[index]
+        self.pos.turn = turn
+
+
+cdef inline int64_t _popcount(int64_t bb) noexcept nogil:
+    cdef int64_t count = 0
+    while bb:
+        bb &= bb - 1
+        count += 1
+    return count
+
+
+cdef int64_t _attack_mask(Position* p, int base) noexcept nogil:
+    cdef int64_t mask = 0
+    cdef int64_t pieces
+    cdef int piece_type, sq
+    for piece_type in range(4):
+        pieces = p.bb[base + piece_type]
+        for sq in range(49):
+            if (pieces >> sq) & 1:
+                mask |= ATTACKS[piece_type][sq]
+    return mask
+
+
+cdef int64_t _evaluate(Position* p, int side) noexcept nogil:
+    cdef int64_t score = 0
+    cdef int piece_type
+    for piece_type in range(3):
+        score += VALUES[piece_type] * (_popcount(p.bb[piece_type]) - _popcount(p.bb[4 + piece_type]))
+    score += MOBILITY_WEIGHT * (_popcount(_attack_mask(p, 0) & ~p.occ[0])
+                                - _popcount(_attack_mask(p, 4) & ~p.occ[1]))
+    return score if side == 0 else -score
+
+
+cdef inline void _toggle(Position* p, int side, int piece_type, int victim, int start_sq, int end_sq) noexcept nogil:
+    # Applies a move, or reverts it when called a second time with the same arguments
+    cdef int64_t start_bit = (<int64_t>1) << start_sq
+    cdef int64_t end_bit = (<int64_t>1) << end_sq
+    p.bb[side * 4 + piece_type] ^= start_bit | end_bit
+    p.occ[side] ^= start_bit | end_bit
+    if victim >= 0:
+        p.bb[(1 - side) * 4 + victim] ^= end_bit
+        p.occ[1 - side] ^= end_bit
+
+
+cdef int64_t _qsearch(Position* p, int side, int64_t alpha, int64_t beta) noexcept nogil:
+    cdef int64_t stand_pat, targets, occ, score
+    cdef int victim, piece_type, start_sq, end_sq, own_base, enemy_base
+    cdef bint sliding
+
+    own_base = side * 4
+    enemy_base = (1 - side) * 4
+    if p.bb[own_base + 3] == 0:
+        return -INF         # Own Cuttlefish was captured
+
+    stand_pat = _evaluate(p, side)
+    if stand_pat >= beta:
+        return beta
+    if stand_pat > alpha:
+        alpha = stand_pat
+
+    occ = p.occ[0] | p.occ[1]
+    for victim in range(3, -1, -1):
+        for piece_type in range(4):
+            sliding = piece_type == 0 or piece_type == 2
+            for start_sq in range(49):
+                if not (p.bb[own_base + piece_type] >> start_sq) & 1:
+                    continue
+                targets = ATTACKS[piece_type][start_sq] & p.bb[enemy_base + victim]
+                for end_sq in range(49):
+                    if not (targets >> end_sq) & 1:
+                        continue
+                    if sliding and occ & BETWEEN[start_sq][end_sq]:
+                        continue
+                    _toggle(p, side, piece_type, victim, start_sq, end_sq)
+                    score = -_qsearch(p, 1 - side, -beta, -alpha)
+                    _toggle(p, side, piece_type, victim, start_sq, end_sq)
+                    if score >= beta:
+                        return beta
+                    if score > alpha:
+                        alpha = score
+    return alpha
+
+
+cdef int64_t _negamax(Position* p, int side, int depth, int64_t alpha, int64_t beta) noexcept nogil:
+    cdef int64_t targets_allowed, targets, occ, score
+    cdef int phase, piece_type, start_sq, end_sq, own_base, enemy_base
+    cdef bint sliding
+    cdef bint has_move = False
+
+    own_base = side * 4
+    enemy_base = (1 - side) * 4
+    if p.bb[own_base + 3] == 0:
+        return -INF         # Own Cuttlefish was captured
+    if depth == 0:
+        return _qsearch(p, side, alpha, beta)
+
+    occ = p.occ[0] | p.occ[1]
+    # Phases 3..0 capture that piece type (most valuable first), phase -1 is quiet moves
+    for phase in range(3, -2, -1):
+        if phase < 0:
+            targets_allowed = ~occ
+        else:
+            targets_allowed = p.bb[enemy_base + phase]
+        for piece_type in range(4):
+            sliding = piece_type == 0 or piece_type == 2
+            for start_sq in range(49):
+                if not (p.bb[own_base + piece_type] >> start_sq) & 1:
+                    continue
+                targets = ATTACKS[piece_type][start_sq] & targets_allowed
+                for end_sq in range(49):
+                    if not (targets >> end_sq) & 1:
+                        continue
+                    if sliding and occ & BETWEEN[start_sq][end_sq]:
+                        continue
+                    has_move = True
+                    _toggle(p, side, piece_type, phase, start_sq, end_sq)
+                    score = -_negamax(p, 1 - side, depth - 1, -beta, -alpha)
+                    _toggle(p, side, piece_type, phase, start_sq, end_sq)
+                    if score >= beta:
+                        return beta
+                    if score > alpha:
+                        alpha = score
+
+    if not has_move:
+        return _evaluate(p, side)
+    return alpha
+
+
+cpdef int64_t negamax(State s, int depth, int64_t alpha, int64_t beta):
+    """
+    Negamax with alpha-beta pruning from the side to move's point of view.
+    The state is restored before returning.
+    """
+    cdef int64_t score
+    with nogil:
+        score = _negamax(&s.pos, s.pos.turn, depth, alpha, beta)
+    return score
+
+
+cpdef int best_move(State s, int depth):
+    """
+    Root of the search.
+
+    Returns:
+        int: Best move encoded as start_sq * 49 + end_sq, or -1 if there is none
+    """
+    cdef Position* p = &s.pos
+    cdef int side = p.turn
+    cdef int own_base = side * 4
+    cdef int enemy_base = (1 - side) * 4
+    cdef int64_t occ = p.occ[0] | p.occ[1]
+    cdef int64_t alpha = -INF - 1
+    cdef int64_t targets, score
+    cdef int piece_type, start_sq, end_sq, victim, captured
+    cdef int best = -1
+    cdef bint sliding
+
+    with nogil:
+        for piece_type in range(4):
+            sliding = piece_type == 0 or piece_type == 2
+            for start_sq in range(49):
+                if not (p.bb[own_base + piece_type] >> start_sq) & 1:
+                    continue
+                targets = ATTACKS[piece_type][start_sq] & ~p.occ[side]
+                for end_sq in range(49):
+                    if not (targets >> end_sq) & 1:
+                        continue
+                    if sliding and occ & BETWEEN[start_sq][end_sq]:
+                        continue
+                    # Find the captured piece type, if any
+                    captured = -1
+                    for victim in range(4):
+                        if (p.bb[enemy_base + victim] >> end_sq) & 1:
+                            captured = victim
+                    _toggle(p, side, piece_type, captured, start_sq, end_sq)
+                    score = -_negamax(p, 1 - side, depth - 1, -INF - 1, -alpha)
+                    _toggle(p, side, piece_type, captured, start_sq, end_sq)
+                    if score > alpha:
+                        alpha = score
+                        best = start_sq * 49 + end_sq
+    return best